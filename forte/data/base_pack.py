@@ -30,6 +30,7 @@ from typing import (
     Dict,
     Any,
     Iterable,
+    Collection,
 )
 from functools import partial
 from inspect import isclass
@@ -702,6 +703,23 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
         # Record that this entry hasn't been added to the index yet.
         self._pending_entries[entry.tid] = c
 
+    def _get_entries(self, tids: Collection[int]) -> List[EntryType]:
+        r"""Look up the entries of a collection of ``tid``. The entries are
+        fetched from the index in one batch, falling back to
+        :meth:`get_entry` one by one if any of them is not indexed.
+
+        Args:
+            tids: The ``tid`` of the entries to look up.
+
+        Returns:
+            A list of the entries, in the iteration order of ``tids``.
+        """
+        try:
+            # pylint: disable=protected-access
+            return self._index._get_entries(tids)
+        except KeyError:
+            return [self.get_entry(tid) for tid in tids]
+
     # TODO: how to make this return the precise type here?
     def get_entry(self, tid: int) -> EntryType:
         r"""Look up the entry_index with ``tid``. Specific implementation
@@ -797,9 +815,10 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
             component: The component (creator) to find ids for.
 
         Returns:
-            A set of entry ids that are created by the component.
+            A set of entry ids that are created by the component. The set is
+            empty if the component has not created any entry in this pack.
         """
-        entry_set: Set[int] = self._creation_records[component]
+        entry_set: Set[int] = self._creation_records.get(component, set())
         return entry_set
 
     def is_created_by(
@@ -819,7 +838,7 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
             components = [components]
 
         for c in components:
-            if entry.tid in self._creation_records[c]:
+            if entry.tid in self.get_ids_by_creator(c):
                 break
         else:
             # The entry not created by any of these components.
@@ -839,9 +858,7 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
         Returns:
             The set of entry ids that are created by the input component.
         """
-        return {
-            self.get_entry(tid) for tid in self.get_ids_by_creator(component)
-        }
+        return set(self._get_entries(self.get_ids_by_creator(component)))
 
     def get_ids_from(self, components: List[str]) -> Set[int]:
         """
@@ -913,7 +930,6 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
     def get_links_from_node(
         self, node: Union[int, EntryType], as_parent: bool
     ) -> List[LinkType]:
-        links: List[LinkType] = []
         if isinstance(node, Entry):
             tid = node.tid
             if tid is None:
@@ -932,11 +948,11 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
         if not self._index.link_index_on:
             self._index.build_link_index(self.links)
 
-        for tid in self._index.link_index(tid, as_parent=as_parent):
-            entry: EntryType = self.get_entry(tid)
-            if self.validate_link(entry):
-                links.append(entry)  # type: ignore
-        return links
+        # The link index only holds entries that are validated as links when
+        # they are indexed, so they are not checked again here.
+        return self._get_entries(  # type: ignore
+            self._index.link_index(tid, as_parent=as_parent)
+        )
 
     def get_links_by_parent(
         self, parent: Union[int, EntryType]
@@ -951,7 +967,6 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
     def get_groups_by_member(
         self, member: Union[int, EntryType]
     ) -> Set[GroupType]:
-        groups: Set[GroupType] = set()
         if isinstance(member, Entry):
             tid = member.tid
             if tid is None:
@@ -970,11 +985,11 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
         if not self._index.group_index_on:
             self._index.build_group_index(self.groups)
 
-        for tid in self._index.group_index(tid):
-            entry: EntryType = self.get_entry(tid)
-            if self.validate_group(entry):
-                groups.add(entry)  # type: ignore
-        return groups
+        # The group index only holds entries that are validated as groups
+        # when they are indexed, so they are not checked again here.
+        return set(
+            self._get_entries(self._index.group_index(tid))  # type: ignore
+        )
 
 
 PackType = TypeVar("PackType", bound=BasePack)
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from abc import abstractmethod
-from typing import List, Iterator, Tuple, Any, Optional, Dict
+from typing import List, Iterator, Tuple, Any, Optional, Dict, Type
 import json
 
 __all__ = ["BaseStore"]
@@ -359,6 +359,19 @@ class BaseStore:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def _get_entry_class(self, type_name: str) -> Type:
+        r"""This function takes a fully qualified ``type_name`` class name and
+        returns the entry class it refers to.
+
+        Args:
+            type_name: A fully qualified name of an entry class.
+
+        Returns:
+            The entry class of ``type_name``.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _is_annotation(self, type_name: str) -> bool:
         r"""This function takes a type_name and returns whether a type
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from bisect import bisect_left
 from enum import IntEnum
+from itertools import chain
 import logging
 from pathlib import Path
 from typing import (
@@ -200,7 +202,20 @@ class DataPack(BasePack[Entry, Link, Group]):
             payload.set_pack(self)
 
         self._index = DataIndex()
-        self._index.update_basic_index(list(iter(self)))
+        # The index does not depend on the order of the entries, so read them
+        # straight from the data store instead of building the sorted
+        # containers behind ``iter(self)``.
+        self._index.update_basic_index(
+            list(
+                chain(
+                    self.all_annotations,
+                    self.all_links,
+                    self.all_groups,
+                    self.all_generic_entries,
+                    self.all_audio_annotations,
+                )
+            )
+        )
 
     def __iter__(self):
         yield from self.annotations
@@ -1134,15 +1149,36 @@ class DataPack(BasePack[Entry, Link, Group]):
             context_type_, context_args
         )
 
+        # Parse the request of each entry type on its first use, instead of
+        # once for every context. Types the contexts never reach are not
+        # parsed, as before.
+        request_args: Dict[
+            Type[Entry], Tuple[Optional[Iterable[str]], Optional[str], Set]
+        ] = {}
+
+        def get_request_args(
+            e_type: Type[Entry], e_args: Any
+        ) -> Tuple[Optional[Iterable[str]], Optional[str], Set]:
+            if e_type not in request_args:
+                request_args[e_type] = self._parse_request_args(e_type, e_args)
+            return request_args[e_type]
+
         valid_context_ids: Set[int] = self._index.query_by_type_subtype(
             context_type_
         )
 
         if context_components:
-            valid_component_id: Set[int] = set()
-            for component in context_components:
-                valid_component_id |= self.get_ids_by_creator(component)
-            valid_context_ids &= valid_component_id
+            # The type index returns a cached set, so intersect into a new
+            # set instead of updating it in place. Intersecting with each
+            # component separately lets every intersection iterate the
+            # smaller side, instead of first building the union of all the
+            # entries created by the components.
+            valid_context_ids = set().union(
+                *(
+                    valid_context_ids & self.get_ids_by_creator(component)
+                    for component in context_components
+                )
+            )
 
         def get_annotation_list(
             c_type: Union[Type[Annotation], Type[AudioAnnotation]]
@@ -1160,14 +1196,12 @@ class DataPack(BasePack[Entry, Link, Group]):
 
             Returns:
                 List(Union[Annotation, AudioAnnotation]):
-                    a list of annotations which is a copy of `self.annotations`
-                    and it enables modifications of `self.annotations` while
-                    iterating through its copy.
+                    a sorted list of the annotations of `c_type` (including
+                    its sub types). It is a snapshot that enables
+                    modifications of the data pack while iterating through it.
             """
-            if issubclass(c_type, Annotation):
-                return list(self.annotations)
-            elif issubclass(c_type, AudioAnnotation):
-                return list(self.audio_annotations)
+            if issubclass(c_type, (Annotation, AudioAnnotation)):
+                return self.get_list(c_type)
             else:
                 raise NotImplementedError(
                     f"Context type is set to {c_type},"
@@ -1246,7 +1280,10 @@ class DataPack(BasePack[Entry, Link, Group]):
                     data[
                         a_type.__name__
                     ] = self._generate_annotation_entry_data(
-                        a_type, a_args, data, context
+                        a_type,
+                        get_request_args(a_type, a_args),
+                        data,
+                        context,
                     )
 
             if audio_annotation_types:
@@ -1260,7 +1297,10 @@ class DataPack(BasePack[Entry, Link, Group]):
                     data[
                         a_type.__name__
                     ] = self._generate_annotation_entry_data(
-                        a_type, a_args, data, context
+                        a_type,
+                        get_request_args(a_type, a_args),
+                        data,
+                        context,
                     )
 
             if link_types:
@@ -1272,7 +1312,10 @@ class DataPack(BasePack[Entry, Link, Group]):
                             f"same time is not allowed"
                         )
                     data[l_type.__name__] = self._generate_link_entry_data(
-                        l_type, l_args, data, context
+                        l_type,
+                        get_request_args(l_type, l_args),
+                        data,
+                        context,
                     )
             # TODO: Getting Group based on range is not done yet.
             if group_types:
@@ -1325,15 +1368,20 @@ class DataPack(BasePack[Entry, Link, Group]):
     def _generate_annotation_entry_data(
         self,
         a_type: Union[Type[Annotation], Type[AudioAnnotation]],
-        a_args: Union[Dict, Iterable],
+        request_args: Tuple[Optional[Iterable[str]], Optional[str], Set],
         data: Dict,
         cont: Optional[Annotation],
     ) -> Dict:
 
-        components, unit, fields = self._parse_request_args(a_type, a_args)
+        components, unit, fields = request_args
 
         a_dict: Dict[str, Any] = {}
         a_dict["span"] = []
+        # The spans are collected as flat lists of begins and ends and copied
+        # into typed arrays at the end, which avoids numpy inferring the shape
+        # and type of a list of tuples.
+        begins: List[int] = []
+        ends: List[int] = []
         # For AudioAnnotation, since the data is single numpy array
         # we don't initialize an empty list for a_dict["audio"]
         if issubclass(a_type, Annotation):
@@ -1351,17 +1399,37 @@ class DataPack(BasePack[Entry, Link, Group]):
                     f"request {unit} before {a_type}."
                 )
             a_dict["unit_span"] = []
+            unit_span_begins: List[int] = []
+            unit_span_ends: List[int] = []
+            # The unit entries are sorted by their spans, so the units covered
+            # by an annotation can be located by binary search on the begins.
+            unit_spans = data[unit]["span"].reshape(-1, 2)
+            unit_begins: List[int] = unit_spans[:, 0].tolist()
+            unit_ends: List[int] = unit_spans[:, 1].tolist()
+            num_units = len(unit_begins)
+
+        # The fields that are read from the annotation attributes.
+        attr_fields = [
+            field
+            for field in fields
+            if field not in ("span", "text", "audio", "context_span")
+        ]
 
         cont_begin = cont.begin if cont else 0
         annotation: Union[Type[Annotation], Type[AudioAnnotation]]
-        for annotation in self.get(a_type, cont, components):  # type: ignore
+        for annotation in self.get_list(a_type, cont, components):  # type: ignore
+            # Each read of the span goes through the data store, so read it
+            # once per annotation.
+            begin = annotation.begin
+            end = annotation.end
             # we provide span, text (and also tid) by default
-            a_dict["span"].append((annotation.begin, annotation.end))
+            begins.append(begin)
+            ends.append(end)
 
             if isinstance(annotation, Annotation):
-                a_dict["text"].append(annotation.text)
+                a_dict["text"].append(self.get_span_text(begin, end))
             elif isinstance(annotation, AudioAnnotation):
-                a_dict["audio"].append(annotation.audio)
+                a_dict["audio"].append(self.get_span_audio(begin, end))
             else:
                 raise NotImplementedError(
                     f"Annotation is set to {annotation}"
@@ -1369,51 +1437,58 @@ class DataPack(BasePack[Entry, Link, Group]):
                     "instances of [Annotation, "
                     "AudioAnnotation] and their subclass."
                 )
-            for field in fields:
-                if field in ("span", "text", "audio"):
-                    continue
-                if field == "context_span":
-                    a_dict[field].append(
-                        (
-                            annotation.begin - cont_begin,
-                            annotation.end - cont_begin,
-                        )
-                    )
-                    continue
-
+            for field in attr_fields:
                 a_dict[field].append(getattr(annotation, field))
 
             if unit is not None:
-                while not self._index.in_span(
-                    data[unit]["tid"][unit_begin],
-                    annotation.span,
-                ):
-                    unit_begin += 1
-
+                # Annotations are yielded in sorted order, so the search for
+                # the first covered unit can start from the previous result.
+                unit_begin = bisect_left(unit_begins, begin, unit_begin)
                 unit_span_begin = unit_begin
-                unit_span_end = unit_span_begin + 1
+                unit_span_end = unit_span_begin
 
-                while self._index.in_span(
-                    data[unit]["tid"][unit_span_end],
-                    annotation.span,
+                while (
+                    unit_span_end < num_units
+                    and unit_ends[unit_span_end] <= end
                 ):
                     unit_span_end += 1
 
-                a_dict["unit_span"].append((unit_span_begin, unit_span_end))
+                unit_span_begins.append(unit_span_begin)
+                unit_span_ends.append(unit_span_end)
+
         for key, value in a_dict.items():
-            a_dict[key] = np.array(value)
+            if key == "span":
+                a_dict[key] = self._to_span_array(begins, ends)
+            elif key == "context_span":
+                a_dict[key] = self._to_span_array(begins, ends) - cont_begin
+            elif key == "unit_span":
+                a_dict[key] = self._to_span_array(
+                    unit_span_begins, unit_span_ends
+                )
+            else:
+                a_dict[key] = np.array(value)
 
         return a_dict
 
+    @staticmethod
+    def _to_span_array(begins: List[int], ends: List[int]) -> np.ndarray:
+        r"""Copy the begins and ends of a list of spans into a preallocated
+        ``(n, 2)`` integer array.
+        """
+        spans = np.empty((len(begins), 2), dtype=np.int64)
+        spans[:, 0] = begins
+        spans[:, 1] = ends
+        return spans
+
     def _generate_link_entry_data(
         self,
         a_type: Type[Link],
-        a_args: Union[Dict, Iterable],
+        request_args: Tuple[Optional[Iterable[str]], Optional[str], Set],
         data: Dict,
         cont: Optional[Annotation],
     ) -> Dict:
 
-        components, unit, fields = self._parse_request_args(a_type, a_args)
+        components, unit, fields = request_args
 
         if unit is not None:
             raise ValueError(f"Link entries cannot be indexed by {unit}.")
@@ -1424,8 +1499,24 @@ class DataPack(BasePack[Entry, Link, Group]):
         a_dict["parent"] = []
         a_dict["child"] = []
 
+        # Map the tids of each referenced entry type to their positions in
+        # `data`, built once per type on first use.
+        tid_to_idx: Dict[str, Dict[int, int]] = {}
+
+        def get_idx(entry_type: str, tid: Optional[int], link: Link) -> int:
+            if entry_type not in tid_to_idx:
+                tid_to_idx[entry_type] = {
+                    t: i for i, t in enumerate(data[entry_type]["tid"])
+                }
+            if tid is None or tid not in tid_to_idx[entry_type]:
+                raise ValueError(
+                    f"The entry {tid} linked by {link} is not among the "
+                    f"requested {entry_type} entries in the context."
+                )
+            return tid_to_idx[entry_type][tid]
+
         link: Link
-        for link in self.get(a_type, cont, components):
+        for link in self.get_list(a_type, cont, components):
             parent_type = link.ParentType.__name__
             child_type = link.ChildType.__name__
 
@@ -1442,12 +1533,8 @@ class DataPack(BasePack[Entry, Link, Group]):
                     f"{a_type}"
                 )
 
-            a_dict["parent"].append(
-                np.where(data[parent_type]["tid"] == link.parent)[0][0]
-            )
-            a_dict["child"].append(
-                np.where(data[child_type]["tid"] == link.child)[0][0]
-            )
+            a_dict["parent"].append(get_idx(parent_type, link.parent, link))
+            a_dict["child"].append(get_idx(child_type, link.child, link))
 
             for field in fields:
                 if field in ("parent", "child"):
@@ -1456,7 +1543,12 @@ class DataPack(BasePack[Entry, Link, Group]):
                 a_dict[field].append(getattr(link, field))
 
         for key, value in a_dict.items():
-            a_dict[key] = np.array(value)
+            if key in ("parent", "child"):
+                a_dict[key] = np.fromiter(
+                    value, dtype=np.int64, count=len(value)
+                )
+            else:
+                a_dict[key] = np.array(value)
         return a_dict
 
     def build_coverage_for(
@@ -1583,6 +1675,61 @@ class DataPack(BasePack[Entry, Link, Group]):
         Yields:
             Each `Entry` found using this method.
         """
+        for tid in self._get_tids(
+            entry_type, range_annotation, components, include_sub_type
+        ):
+            yield self.get_entry(tid=tid)  # type: ignore
+
+    def get_list(
+        self,
+        entry_type: Union[str, Type[EntryType]],
+        range_annotation: Optional[Union[Annotation, AudioAnnotation]] = None,
+        components: Optional[Union[str, Iterable[str]]] = None,
+        include_sub_type: bool = True,
+    ) -> List[EntryType]:
+        r"""Get the same entries as :meth:`get`, but as a list. The entries
+        are looked up in one batch after all the matching ids are found,
+        which is faster than :meth:`get` when all the entries are consumed.
+        The returned list is a snapshot, so the data pack can be modified
+        while iterating through it. :meth:`get` is lazy and walks the live
+        entry lists of the data store, so prefer it when only the first few
+        entries are needed.
+
+        Args:
+            entry_type: The type of entries requested.
+            range_annotation: The
+                range of entries requested. If `None`, will return valid
+                entries in the range of whole data pack.
+            components: The component (creator)
+                generating the entries requested. If `None`, will return valid
+                entries generated by any component.
+            include_sub_type: whether to consider the sub types of
+                the provided entry type. Default `True`.
+
+        Returns:
+            A list of the entries found, in the same order as :meth:`get`.
+        """
+        return self._get_entries(  # type: ignore
+            list(
+                self._get_tids(
+                    entry_type, range_annotation, components, include_sub_type
+                )
+            )
+        )
+
+    def _get_tids(
+        self,
+        entry_type: Union[str, Type[EntryType]],
+        range_annotation: Optional[Union[Annotation, AudioAnnotation]] = None,
+        components: Optional[Union[str, Iterable[str]]] = None,
+        include_sub_type: bool = True,
+    ) -> Iterator[int]:
+        r"""Find the ids of the entries requested by :meth:`get`. See
+        :meth:`get` for the arguments.
+
+        Yields:
+            The ``tid`` of each entry found.
+        """
         entry_type_: Type[EntryType] = as_entry_type(entry_type)
 
         def require_annotations(entry_class=Annotation) -> bool:
@@ -1597,21 +1744,20 @@ class DataPack(BasePack[Entry, Link, Group]):
             return False
 
         # If we don't have any annotations but the items to check requires them,
-        # then we simply yield from an empty list.
+        # then there is nothing to yield.
         if (
-            len(self.annotations) == 0
+            self.num_annotations == 0
             and isinstance(range_annotation, Annotation)
             and require_annotations(Annotation)
         ) or (
-            len(self.audio_annotations) == 0
+            self.num_audio_annotations == 0
             and isinstance(range_annotation, AudioAnnotation)
             and require_annotations(AudioAnnotation)
         ):
-            yield from []
             return
 
         # If the ``entry_type`` and `range_annotation` are for different types of
-        # payload, then we yield from an empty list with a warning.
+        # payload, then there is nothing to yield, with a warning.
         if (
             require_annotations(Annotation)
             and isinstance(range_annotation, AudioAnnotation)
@@ -1627,36 +1773,56 @@ class DataPack(BasePack[Entry, Link, Group]):
                 "arguments and make sure they are associated with the same type"
                 " of payload (i.e., either text or audio)."
             )
-            yield from []
             return
 
+        # Whether Links and Groups need to be filtered by the audio span,
+        # which only depends on the arguments.
+        check_audio_span = issubclass(
+            entry_type_, (Link, Group)
+        ) and isinstance(range_annotation, AudioAnnotation)
+
         try:
-            for entry_data in self._data_store.get(
+            entries_data = self._data_store.get(
                 type_name=get_full_module_name(entry_type_),
                 include_sub_type=include_sub_type,
                 range_span=range_annotation  # type: ignore
                 and (range_annotation.begin, range_annotation.end),
-            ):
-                entry: Entry = self.get_entry(tid=entry_data[TID_INDEX])
+            )
+            if components is None and not check_audio_span:
+                # Nothing to filter, so yield the ids directly.
+                for entry_data in entries_data:
+                    yield entry_data[TID_INDEX]
+                return
+
+            # Look up the entries created by the components once, so that
+            # entries can be filtered by tid before they are materialized.
+            valid_component_ids: Optional[Set[int]] = None
+            if components is not None:
+                valid_component_ids = self.get_ids_from(
+                    [components]
+                    if isinstance(components, str)
+                    else list(components)
+                )
+
+            for entry_data in entries_data:
+                tid: int = entry_data[TID_INDEX]
                 # Filter by components
-                if components is not None:
-                    if not self.is_created_by(entry, components):
-                        continue
+                if (
+                    valid_component_ids is not None
+                    and tid not in valid_component_ids
+                ):
+                    continue
 
                 # Filter out incompatible audio span comparison for Links and Groups
-                if (
-                    issubclass(entry_type_, (Link, Group))
-                    and isinstance(range_annotation, AudioAnnotation)
-                    and not self._index.in_audio_span(
-                        entry, range_annotation.span
-                    )
+                if check_audio_span and not self._index.in_audio_span(
+                    self.get_entry(tid=tid), range_annotation.span  # type: ignore
                 ):
                     continue
 
-                yield entry  # type: ignore
+                yield tid
         except ValueError:
             # type_name does not exist in DataStore
-            yield from []
+            return
 
     def update(self, datapack: "DataPack"):
         r"""Update the attributes and properties of the current DataPack with
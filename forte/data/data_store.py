@@ -14,11 +14,13 @@
 from copy import deepcopy
 import json
 import sys
-from typing import Dict, List, Iterator, Set, Tuple, Optional, Any
+from typing import Dict, List, Iterator, Set, Tuple, Optional, Any, Type
 
 import uuid
 import logging
 from heapq import heappush, heappop
+from itertools import compress
+import numpy as np
 from sortedcontainers import SortedList
 from typing_inspect import get_origin, get_args, is_generic_type
 
@@ -57,6 +59,9 @@ class DataStore(BaseStore):
     # pylint: disable=attribute-defined-outside-init
     # pylint: disable=too-many-public-methods
     _type_attributes: dict = {}
+    # The entry classes resolved from their type names, shared by all the
+    # data stores since a type name always resolves to the same class.
+    _type_classes: Dict[str, Type] = {}
     onto_gen = OntologyCodeGenerator()
     do_init = False
 
@@ -280,6 +285,21 @@ class DataStore(BaseStore):
         """
         self.__deletion_count: dict = {}
 
+        """
+        A dictionary that caches the ``begin`` and ``end`` fields of the
+        annotation-like entry lists as numpy arrays, so that range queries can
+        locate their entries with vectorized searches instead of walking the
+        entry lists. A flat copy of the entry list is cached along with them,
+        so the located entries can be sliced out of it directly. The cache of
+        a type is built lazily on the first range query and dropped whenever
+        an entry of that type is added, removed or modified. The cached entry
+        list is kept along with the arrays so that a replaced list is never
+        served stale spans.
+        It is a key-value map of
+        {type_name: (entry list, flat entry list, begin array, end array)}.
+        """
+        self.__span_arrays: dict = {}
+
     def __getstate__(self):
         r"""
         In serialization,
@@ -304,6 +324,7 @@ class DataStore(BaseStore):
         state.pop("_DataStore__tid_ref_dict")
         state.pop("_DataStore__tid_idx_dict")
         state.pop("_DataStore__deletion_count")
+        state.pop("_DataStore__span_arrays", None)
         state.pop("_type_attributes", None)
         state["entries"] = state.pop("_DataStore__elements")
         for _, v in state["fields"].items():
@@ -329,6 +350,7 @@ class DataStore(BaseStore):
         self._DataStore__tid_ref_dict = {}
         self._DataStore__tid_idx_dict = {}
         self._DataStore__deletion_count = {}
+        self._DataStore__span_arrays = {}
 
         # Update `_type_attributes` to store the types of each
         # entry attribute as well.
@@ -838,6 +860,24 @@ class DataStore(BaseStore):
 
         return type_dict
 
+    @classmethod
+    def _get_entry_class(cls, type_name: str) -> Type:
+        r"""Get the entry class of ``type_name``. The class is looked up with
+        :func:`~forte.utils.utils.get_class` the first time and cached
+        afterwards, which avoids importing it again on every query.
+
+        Args:
+            type_name: A fully qualified name of an entry class.
+
+        Returns:
+            The entry class of ``type_name``.
+        """
+        try:
+            return cls._type_classes[type_name]
+        except KeyError:
+            entry_class = cls._type_classes[type_name] = get_class(type_name)
+            return entry_class
+
     def _is_subclass(
         self, type_name: str, cls, no_dynamic_subclass: bool = False
     ) -> bool:
@@ -879,7 +919,7 @@ class DataStore(BaseStore):
             if cls_qualified_name in type_name_parent_class:
                 return True
             else:
-                entry_class = get_class(type_name)
+                entry_class = self._get_entry_class(type_name)
                 if issubclass(entry_class, cls):
                     type_name_parent_class.add(cls_qualified_name)
                     return True
@@ -905,7 +945,7 @@ class DataStore(BaseStore):
                 entry_type_key == entry_type_name and inclusive
             ) or self._is_subclass(
                 entry_type_key,
-                get_class(entry_type_name),
+                self._get_entry_class(entry_type_name),
             ):
                 yield entry_type_key
 
@@ -1021,6 +1061,7 @@ class DataStore(BaseStore):
         """
         if self._is_annotation(type_name):
             sorting_fn = self.get_annotation_sorting_fn(type_name)
+            self.__span_arrays.pop(type_name, None)
             try:
                 self.__elements[type_name].add(entry)
             except KeyError:
@@ -1301,16 +1342,19 @@ class DataStore(BaseStore):
         if type_name not in self.__elements:
             return -1
         if self._is_annotation(type_name):
-            # Return the tid of existing entry if duplicate is not allowed
-            index = self.__elements[type_name].bisect_left(entry)
-            target_entry = self.__elements[type_name][index]
-            if (
-                target_entry[begin_idx] == begin
-                and target_entry[end_idx] == end
-            ):
-                return target_entry[constants.TID_INDEX]
-            else:
-                return -1
+            # Return the tid of existing entry if duplicate is not allowed.
+            # The entry list is keyed by (begin, end), so we can bisect with
+            # the key directly and only need to inspect a single entry.
+            target_list = self.__elements[type_name]
+            index = target_list.bisect_key_left((begin, end))
+            if index < len(target_list):
+                target_entry = target_list[index]
+                if (
+                    target_entry[begin_idx] == begin
+                    and target_entry[end_idx] == end
+                ):
+                    return target_entry[constants.TID_INDEX]
+            return -1
         else:
             raise ValueError(
                 f"Get existing entry id for {type_name}"
@@ -1341,6 +1385,7 @@ class DataStore(BaseStore):
         except KeyError as e:
             raise KeyError(f"{entry_type} has no {attr_name} attribute.") from e
 
+        self.__span_arrays.pop(entry_type, None)
         entry[attr_id] = attr_value
 
     def _set_attr(self, tid: int, attr_id: int, attr_value: Any):
@@ -1353,7 +1398,8 @@ class DataStore(BaseStore):
             attr_id: The id of the attribute.
             attr_value: The value of the attribute.
         """
-        entry, _ = self.get_entry(tid)
+        entry, entry_type = self.get_entry(tid)
+        self.__span_arrays.pop(entry_type, None)
         entry[attr_id] = attr_value
 
     def get_attribute(self, tid: int, attr_name: str) -> Any:
@@ -1479,6 +1525,7 @@ class DataStore(BaseStore):
             )
         if self._is_annotation(type_name):
             target_list.pop(index_id)
+            self.__span_arrays.pop(type_name, None)
             if not target_list:
                 self.__elements.pop(type_name)
         else:
@@ -1598,40 +1645,88 @@ class DataStore(BaseStore):
             List of entries to fetch
         """
 
-        begin = self.get_datastore_attr_idx(
-            type_name, constants.BEGIN_ATTR_NAME
+        entries, begins, ends = self._get_sorted_spans(search_list, type_name)
+
+        # Entries are sorted by ``begin``, so the candidates are the ones
+        # whose ``begin`` falls in the range; of those, keep the ones that
+        # also end within the range.
+        begin_index = np.searchsorted(begins, range_span[0], side="left")
+        end_index = np.searchsorted(begins, range_span[1], side="right")
+        result_list = list(
+            compress(
+                entries[begin_index:end_index],
+                (ends[begin_index:end_index] <= range_span[1]).tolist(),
+            )
         )
-        end = self.get_datastore_attr_idx(type_name, constants.END_ATTR_NAME)
 
-        # Check if there are any entries within the given range
-        if (
-            search_list[0][begin] > range_span[1]
-            or search_list[-1][end] < range_span[0]
-        ):
+        if len(result_list) == 0:
             return None
 
-        result_list = []
+        return result_list
 
-        temp_entry = self.add_entry_raw(
-            type_name=type_name,
-            attribute_data=[range_span[0], range_span[0]],
-        )
+    def _get_sorted_spans(
+        self, search_list: SortedList, type_name: str
+    ) -> Tuple[List, np.ndarray, np.ndarray]:
+        """
+        Get a flat copy of `search_list` together with the ``begin`` and
+        ``end`` fields of its entries as two numpy arrays, building and
+        caching them if they are not cached yet for `type_name`.
 
-        begin_index = search_list.bisect_left(self.get_entry(temp_entry)[0])
+        Args:
+            search_list: The sorted entry list of `type_name`.
+            type_name: Type of entry represented by the DataStore
 
-        self.delete_entry(temp_entry)
+        Returns:
+            A tuple of the entry list, the begin array and the end array.
+        """
+        cached = self.__span_arrays.get(type_name)
+        if cached is not None and cached[0] is search_list:
+            return cached[1], cached[2], cached[3]
 
-        for idx in range(begin_index, len(search_list)):
-            if search_list[idx][begin] > range_span[1]:
-                break
+        begin = self.get_datastore_attr_idx(
+            type_name, constants.BEGIN_ATTR_NAME
+        )
+        end = self.get_datastore_attr_idx(type_name, constants.END_ATTR_NAME)
+        entries = list(search_list)
+        begins = np.fromiter(
+            (entry[begin] for entry in entries),
+            dtype=np.int64,
+            count=len(entries),
+        )
+        ends = np.fromiter(
+            (entry[end] for entry in entries),
+            dtype=np.int64,
+            count=len(entries),
+        )
+        self.__span_arrays[type_name] = (search_list, entries, begins, ends)
+        return entries, begins, ends
 
-            if search_list[idx][end] <= range_span[1]:
-                result_list.append(search_list[idx])
+    def _get_tids_in_range(self, range_span: Tuple[int, int]) -> Set[int]:
+        """
+        Get the tids of all the annotation-like entries (of any type) whose
+        span falls within `range_span`. Links and Groups are in a range when
+        all their nodes are, so this turns their range check into set
+        lookups instead of a span comparison per node.
 
-        if len(result_list) == 0:
-            return None
+        Args:
+            range_span: a tuple that indicates the start and end index
+                of the range in which we want to get required entries
 
-        return result_list
+        Returns:
+            A set of the tids of the annotation-like entries in the range.
+        """
+        in_range: Set[int] = set()
+        for type_name, entries in self.__elements.items():
+            if not self._is_annotation(type_name):
+                continue
+            possible_entries = self._get_bisect_range(
+                entries, range_span, type_name
+            )
+            if possible_entries is not None:
+                in_range.update(
+                    entry[constants.TID_INDEX] for entry in possible_entries
+                )
+        return in_range
 
     def co_iterator_annotation_like(
         self,
@@ -1865,27 +1960,11 @@ class DataStore(BaseStore):
             An iterator of the entries matching the provided arguments.
         """
 
-        def within_range(entry: List[Any], range_span: Tuple[int, int]) -> bool:
-            """
-            A helper function for deciding whether an annotation entry is
-            inside the `range_span`.
-            """
-            begin = self.get_datastore_attr_idx(
-                entry[constants.ENTRY_TYPE_INDEX], constants.BEGIN_ATTR_NAME
-            )
-            end = self.get_datastore_attr_idx(
-                entry[constants.ENTRY_TYPE_INDEX], constants.END_ATTR_NAME
-            )
-
-            if not self._is_annotation(entry[constants.ENTRY_TYPE_INDEX]):
-                return False
-            return entry[begin] >= range_span[0] and entry[end] <= range_span[1]
-
-        entry_class = get_class(type_name)
+        entry_class = self._get_entry_class(type_name)
         all_types = set()
         if include_sub_type:
             for type in self.__elements:
-                if issubclass(get_class(type), entry_class):
+                if issubclass(self._get_entry_class(type), entry_class):
                     all_types.add(type)
         else:
             all_types.add(type_name)
@@ -1900,55 +1979,50 @@ class DataStore(BaseStore):
                 ):
                     yield entry
         elif issubclass(entry_class, Link):
+            # Links and Groups are in the range when all their nodes are, so
+            # collect the nodes in the range once for all the types.
+            in_range: Set[int] = (
+                set()
+                if range_span is None
+                else self._get_tids_in_range(range_span)
+            )
             for type in all_types:
                 if range_span is None:
                     yield from self.iter(type)
                 else:
-                    for entry in self.__elements[type]:
-                        parent_idx = self.get_datastore_attr_idx(
-                            entry[constants.ENTRY_TYPE_INDEX],
-                            constants.PARENT_TID_ATTR_NAME,
-                        )
-                        child_idx = self.get_datastore_attr_idx(
-                            entry[constants.ENTRY_TYPE_INDEX],
-                            constants.CHILD_TID_ATTR_NAME,
-                        )
-
-                        if (entry[parent_idx] in self.__tid_ref_dict) and (
-                            entry[child_idx] in self.__tid_ref_dict
+                    parent_idx = self.get_datastore_attr_idx(
+                        type, constants.PARENT_TID_ATTR_NAME
+                    )
+                    child_idx = self.get_datastore_attr_idx(
+                        type, constants.CHILD_TID_ATTR_NAME
+                    )
+                    for entry in self.iter(type):
+                        if (
+                            entry[parent_idx] in in_range
+                            and entry[child_idx] in in_range
                         ):
-                            parent = self.__tid_ref_dict[entry[parent_idx]]
-                            child = self.__tid_ref_dict[entry[child_idx]]
-                            if within_range(
-                                parent, range_span
-                            ) and within_range(child, range_span):
-                                yield entry
+                            yield entry
         elif issubclass(entry_class, Group):
+            in_range = (
+                set()
+                if range_span is None
+                else self._get_tids_in_range(range_span)
+            )
             for type in all_types:
                 if range_span is None:
                     yield from self.iter(type)
                 else:
-                    for entry in self.__elements[type]:
-                        member_type_idx = self.get_datastore_attr_idx(
-                            entry[constants.ENTRY_TYPE_INDEX],
-                            constants.MEMBER_TYPE_ATTR_NAME,
-                        )
-                        members_idx = self.get_datastore_attr_idx(
-                            entry[constants.ENTRY_TYPE_INDEX],
-                            constants.MEMBER_TID_ATTR_NAME,
-                        )
-
-                        member_type = entry[member_type_idx]
-                        if self._is_annotation(member_type):
-                            members = entry[members_idx]
-                            within = True
-                            for m in members:
-                                e = self.__tid_ref_dict[m]
-                                if not within_range(e, range_span):
-                                    within = False
-                                    break
-                            if within:
-                                yield entry
+                    member_type_idx = self.get_datastore_attr_idx(
+                        type, constants.MEMBER_TYPE_ATTR_NAME
+                    )
+                    members_idx = self.get_datastore_attr_idx(
+                        type, constants.MEMBER_TID_ATTR_NAME
+                    )
+                    for entry in self.iter(type):
+                        if self._is_annotation(
+                            entry[member_type_idx]
+                        ) and in_range.issuperset(entry[members_idx]):
+                            yield entry
         else:
             # Only fetches entries of type ``type_name`` when it's not in
             # [Annotation, Group, List].
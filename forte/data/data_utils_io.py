@@ -136,7 +136,9 @@ def modify_text_and_track_ops(
         orig_text_len: length of original text.
     """
     orig_text_len: int = len(original_text)
-    mod_text: str = original_text
+    # The modified text is assembled from pieces and joined once at the end,
+    # rather than copying the whole text on every replacement.
+    mod_text_pieces: List[str] = []
     increment: int = 0
     prev_span_end: int = 0
     replace_back_operations: List[Tuple[Span, str]] = []
@@ -163,15 +165,18 @@ def modify_text_and_track_ops(
                 "The replacement spans should be mutually exclusive"
             )
         span_begin = span.begin + increment
-        span_end = span.end + increment
-        original_span_text = mod_text[span_begin:span_end]
-        mod_text = mod_text[:span_begin] + replacement + mod_text[span_end:]
+        original_span_text = original_text[span.begin : span.end]
+        mod_text_pieces.append(original_text[prev_span_end : span.begin])
+        mod_text_pieces.append(replacement)
         increment += len(replacement) - (span.end - span.begin)
         replacement_span = Span(span_begin, span_begin + len(replacement))
         replace_back_operations.append((replacement_span, original_span_text))
         processed_original_spans.append((replacement_span, span))
         prev_span_end = span.end
 
+    mod_text_pieces.append(original_text[prev_span_end:])
+    mod_text: str = "".join(mod_text_pieces)
+
     return (
         mod_text,
         replace_back_operations,
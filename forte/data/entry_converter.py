@@ -32,7 +32,7 @@ from forte.data.ontology.top import (
     MultiPackEntries,
 )
 from forte.common import constants
-from forte.utils import get_class, get_full_module_name
+from forte.utils import get_full_module_name
 
 logger = logging.getLogger(__name__)
 
@@ -226,9 +226,9 @@ class EntryConverter:
         data_store_ref = pack._data_store  # pylint: disable=protected-access
         if type_name is None:
             _, type_name = data_store_ref.get_entry(tid=tid)
-        entry_class = get_class(type_name)
         entry: Entry
         # pylint: disable=protected-access
+        entry_class = data_store_ref._get_entry_class(type_name)
         # Here the entry arguments are optional (begin, end, parent, ...) and
         # the value can be arbitrary since they will all be routed to DataStore.
         if data_store_ref._is_annotation(type_name):
@@ -14,7 +14,9 @@
 
 import logging
 from collections import defaultdict
+from operator import itemgetter
 from typing import (
+    Collection,
     DefaultDict,
     Dict,
     List,
@@ -66,6 +68,13 @@ class BaseIndex(Generic[EntryType]):
         # query_by_type_subtype is called.
         self._subtype_index: Dict[Type[EntryType], Set[int]] = {}
 
+        # A cache map from a type to the indexed types that are sub-types of
+        # it (including itself). Types are never removed from the type
+        # index, so this is rebuilt only when the number of indexed types
+        # changes.
+        self._subtype_closure: Dict[Type[EntryType], List[Type[EntryType]]] = {}
+        self._subtype_closure_size: int = 0
+
         self._group_index: DefaultDict[Hashable, Set[int]] = defaultdict(set)
         self._link_index: Dict[str, DefaultDict[Hashable, Set[int]]] = {}
 
@@ -88,16 +97,55 @@ class BaseIndex(Generic[EntryType]):
         Args:
             entries (list): a list of entries to be added into the basic index.
         """
+        entry_index = self._entry_index
+        type_index = self._type_index
+        updated_types: Set[Type[EntryType]] = set()
         for entry in entries:
-            self._entry_index[entry.tid] = entry
-            self._type_index[type(entry)].add(entry.tid)
+            tid = entry.tid
+            entry_type = type(entry)
+            entry_index[tid] = entry
+            type_index[entry_type].add(tid)
+            updated_types.add(entry_type)
+        for entry_type in updated_types:
             # Disable sub type index since new items are added and this will
             #  be rebuilt in next query (`query_by_type_subtype`).
-            self._subtype_index.pop(type(entry), None)
+            self._invalidate_subtype_index(entry_type)
+
+    def _invalidate_subtype_index(self, entry_type: Type[EntryType]):
+        r"""Drop the cached sub type index of ``entry_type`` and of all its
+        super types, since entries of ``entry_type`` are included in all of
+        them.
+
+        Args:
+            entry_type: The type of the entries being added or removed.
+        """
+        # The super types of a class are exactly the classes in its MRO, so
+        # walk the MRO instead of checking every cached type.
+        for t in entry_type.__mro__:
+            self._subtype_index.pop(t, None)
 
     def get_entry(self, tid: int) -> EntryType:
         return self._entry_index[tid]
 
+    def _get_entries(self, tids: Collection[int]) -> List[EntryType]:
+        r"""Look up the entries of a collection of ``tid``, in a single
+        batched lookup on the entry index.
+
+        Args:
+            tids: The ``tid`` of the entries to look up.
+
+        Returns:
+            A list of the entries, in the iteration order of ``tids``.
+
+        Raises:
+            KeyError: when any of the ``tid`` is not in the index.
+        """
+        if len(tids) == 0:
+            return []
+        if len(tids) == 1:
+            return [self._entry_index[tid] for tid in tids]
+        return list(itemgetter(*tids)(self._entry_index))
+
     def indexed_types(self) -> KeysView[Type]:
         return self._type_index.keys()
 
@@ -125,13 +173,36 @@ class BaseIndex(Generic[EntryType]):
         if t in self._subtype_index:
             return self._subtype_index[t]
         else:
-            subclass_index: Set[int] = set()
-            for index_key, index_val in self.iter_type_index():
-                if issubclass(index_key, t):
-                    subclass_index.update(index_val)
+            subclass_index: Set[int] = set().union(
+                *(self._type_index[st] for st in self._get_subtypes(t))
+            )
             self._subtype_index[t] = subclass_index
             return subclass_index
 
+    def _get_subtypes(self, t: Type[EntryType]) -> List[Type[EntryType]]:
+        r"""Get the indexed types that are ``t`` or sub-types of ``t``. The
+        result is cached until a new type is added to the type index.
+
+        Args:
+            t: The type to find the sub-types for.
+
+        Returns:
+            A list of the indexed sub-types of ``t``.
+        """
+        if len(self._type_index) != self._subtype_closure_size:
+            self._subtype_closure = {}
+            self._subtype_closure_size = len(self._type_index)
+        try:
+            return self._subtype_closure[t]
+        except KeyError:
+            subtypes = [
+                index_key
+                for index_key in self._type_index
+                if issubclass(index_key, t)
+            ]
+            self._subtype_closure[t] = subtypes
+            return subtypes
+
     def iter_type_index(self) -> Iterable[Tuple[Type, Set[int]]]:
         for t, ids in self._type_index.items():
             yield t, ids
@@ -139,6 +210,7 @@ class BaseIndex(Generic[EntryType]):
     def remove_entry(self, entry: EntryType):
         self._entry_index.pop(entry.tid)
         self._type_index[type(entry)].remove(entry.tid)
+        self._invalidate_subtype_index(type(entry))
 
         self.turn_group_index_switch(on=False)
         self.turn_link_index_switch(on=False)
@@ -31,7 +31,7 @@ from typing import (
     cast,
 )
 from abc import abstractmethod
-from bisect import bisect_left, bisect_right
+from bisect import bisect_right
 from sortedcontainers.sorteddict import SortedDict
 from sortedcontainers.sortedlist import SortedList
 from forte.data.data_pack import DataPack
@@ -197,21 +197,20 @@ class BaseDataAugmentationOp(Configurable):
             True if the input span overlaps with
             any existing spans, False otherwise.
         """
-        if len(self._replaced_annos[pid]) == 0:
+        replaced_annos = self._replaced_annos[pid]
+        if len(replaced_annos) == 0:
             return False
-        ind: int = (
-            bisect_left(self._replaced_annos[pid], (Span(begin, begin), "")) - 1
+        # Walk the sorted list with ``islice`` rather than indexing into it
+        # positionally, which costs a log(n) lookup per step.
+        ind: int = max(
+            replaced_annos.bisect_key_left(Span(begin, begin)) - 1, 0
         )
-        if ind < 0:
-            ind += 1
 
-        while ind < len(self._replaced_annos[pid]):
-            span: Span = self._replaced_annos[pid][ind][0]
+        for span, _ in replaced_annos.islice(ind):
             if not (span.begin >= end or span.end <= begin):
                 return True
             if span.begin > end:
                 break
-            ind += 1
 
         return False
 
@@ -17,7 +17,7 @@ replacement ops to generate texts similar to those in the input pack
 and create a new pack with them.
 """
 from abc import ABC
-from bisect import bisect_right, bisect_left
+from bisect import bisect_right
 from collections import defaultdict
 from copy import deepcopy
 from typing import List, Tuple, Dict, DefaultDict, Set, Union, cast, Iterable
@@ -292,22 +292,20 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
             True if the input span overlaps with
             any existing spans, False otherwise.
         """
-        if len(self._replaced_annos[pid]) == 0:
+        replaced_annos = self._replaced_annos[pid]
+        if len(replaced_annos) == 0:
             return False
-        ind: int = (
-            bisect_left(self._replaced_annos[pid], (Span(begin, begin), "")) - 1
+        # Walk the sorted list with ``islice`` rather than indexing into it
+        # positionally, which costs a log(n) lookup per step.
+        ind: int = max(
+            replaced_annos.bisect_key_left(Span(begin, begin)) - 1, 0
         )
 
-        if ind < 0:
-            ind += 1
-
-        while ind < len(self._replaced_annos[pid]):
-            span: Span = self._replaced_annos[pid][ind][0]
+        for span, _ in replaced_annos.islice(ind):
             if not (span.begin >= end or span.end <= begin):
                 return True
             if span.begin > end:
                 break
-            ind += 1
 
         return False
 
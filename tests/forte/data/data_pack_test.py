@@ -16,9 +16,12 @@ Unit tests for data pack related operations.
 """
 import os
 import logging
+import pickle
 import unittest
 from typing import List, Tuple
 
+import numpy as np
+
 from forte.data.data_pack import DataPack
 from forte.data.ontology.top import Annotation
 from forte.pipeline import Pipeline
@@ -32,6 +35,7 @@ from ft.onto.base_ontology import (
     PredicateLink,
     PredicateMention,
     CoreferenceGroup,
+    Recording,
 )
 from forte.data.readers import OntonotesReader
 
@@ -98,6 +102,167 @@ class DataPackTest(unittest.TestCase):
         self.assertEqual(len(instances[0]["PredicateLink"]), 4)
         self.assertEqual(len(instances[0]["Token"]), 5)
         self.assertEqual(len(instances[0]["EntityMention"]), 3)
+        self.assertEqual(
+            instances[0]["PredicateArgument"]["unit_span"].tolist(),
+            [[0, 1], [2, 3], [2, 3], [2, 11], [5, 11], [7, 11]],
+        )
+
+        # case 6: the unit span of an entry covering the last unit
+        instances = list(
+            self.data_pack.get_data(
+                Document, request={Token: [], Sentence: {"unit": "Token"}}
+            )
+        )
+        self.assertEqual(
+            instances[0]["Sentence"]["unit_span"].tolist(),
+            [[0, 27], [27, 39]],
+        )
+
+        # case 7: requested types without entries in the context give empty
+        # arrays that keep the (n, 2) span shape and integer dtype.
+        pack = DataPack()
+        pack.set_text("Hello world.")
+        pack.add_all_remaining_entries()
+        pack.add_entry(Sentence(pack, 0, 12))
+        pack.add_entry(Token(pack, 0, 5))
+        instance = next(
+            pack.get_data(
+                Sentence,
+                request={
+                    Token: [],
+                    EntityMention: {"unit": "Token"},
+                    PredicateMention: [],
+                    PredicateLink: {"fields": ["parent", "child"]},
+                },
+            )
+        )
+        for key in ("span", "unit_span"):
+            self.assertEqual(instance["EntityMention"][key].shape, (0, 2))
+            self.assertEqual(instance["EntityMention"][key].dtype, np.int64)
+        for key in ("parent", "child"):
+            self.assertEqual(instance["PredicateLink"][key].shape, (0,))
+            self.assertEqual(instance["PredicateLink"][key].dtype, np.int64)
+
+    def test_get_data_by_context_component(self):
+        pack = DataPack()
+        pack.set_text("Hello world. Bye now.")
+        pack.add_all_remaining_entries()
+        pack.add_entry(Sentence(pack, 0, 12), "comp_a")
+        pack.add_entry(Sentence(pack, 13, 21), "comp_b")
+
+        instances = list(
+            pack.get_data(Sentence, {Sentence: {"component": ["comp_a"]}})
+        )
+        self.assertEqual(len(instances), 1)
+        self.assertEqual(instances[0]["context"], "Hello world.")
+
+        # Filtering the context by component should not affect the index.
+        self.assertEqual(len(list(pack.get_entries_of(Sentence))), 2)
+
+    def test_get_data_unused_request(self):
+        pack = DataPack()
+        pack.set_text("Hello world.")
+        pack.add_all_remaining_entries()
+        pack.add_entry(Token(pack, 0, 5))
+
+        # Requests are only parsed for the types that get_data fetches, so a
+        # malformed request is not reported when no context reaches it.
+        self.assertEqual(list(pack.get_data(Sentence, {Token: 5})), [])
+        self.assertEqual(len(list(pack.get_data(Annotation, {Token: 5}))), 1)
+        with self.assertRaises(TypeError):
+            list(pack.get_data(Token, {Sentence: 5}))
+
+    def test_get_by_components(self):
+        pack = DataPack()
+        pack.set_text("Hello world.")
+        pack.add_all_remaining_entries()
+        pack.add_entry(Sentence(pack, 0, 12), "sent")
+        token = pack.add_entry(Token(pack, 0, 5), "tok")
+
+        # A component that created nothing in this pack is treated as having
+        # an empty set of entries, instead of raising a KeyError.
+        self.assertEqual(pack.get_ids_by_creator("nope"), set())
+        self.assertEqual(pack.get_ids_from(["nope"]), set())
+        self.assertFalse(pack.is_created_by(token, ["nope"]))
+        self.assertTrue(pack.is_created_by(token, ["nope", "tok"]))
+
+        self.assertEqual(
+            list(pack.get(Token, components=["tok", "nope"])), [token]
+        )
+        self.assertEqual(list(pack.get(Token, components="nope")), [])
+        self.assertEqual(list(pack.get(EntityMention, components="nope")), [])
+        self.assertEqual(
+            pack.get_list(Token, components=["nope", "tok"]), [token]
+        )
+
+        instances = list(
+            pack.get_data(Sentence, {Token: {"component": ["nope"]}})
+        )
+        self.assertEqual(len(instances), 1)
+        self.assertEqual(len(instances[0]["Token"]["text"]), 0)
+        self.assertEqual(
+            list(pack.get_data(Sentence, {Sentence: {"component": ["nope"]}})),
+            [],
+        )
+
+    def test_get_entries_of_after_update(self):
+        pack = DataPack()
+        pack.set_text("Hello world.")
+        pack.add_all_remaining_entries()
+        pack.add_entry(Token(pack, 0, 5))
+        self.assertEqual(len(list(pack.get_entries_of(Annotation))), 1)
+
+        # Adding or deleting an entry refreshes the index of its super types.
+        token = pack.add_entry(Token(pack, 6, 11))
+        self.assertEqual(len(list(pack.get_entries_of(Annotation))), 2)
+        pack.delete_entry(token)
+        self.assertEqual(len(list(pack.get_entries_of(Annotation))), 1)
+        self.assertEqual(len(list(pack.get_entries_of(Token))), 1)
+
+    def test_index_after_deserialization(self):
+        pack = DataPack()
+        pack.set_text("Hello world.")
+        pack.set_audio(np.zeros(16), sample_rate=16)
+        pack.add_all_remaining_entries()
+        pack.add_entry(Token(pack, 0, 5))
+        pack.add_entry(Recording(pack, 0, 16))
+
+        for restored in (
+            DataPack.from_string(pack.to_string()),
+            pickle.loads(pickle.dumps(pack)),
+        ):
+            self.assertEqual(len(list(restored.get_entries_of(Token))), 1)
+            recordings = list(restored.get_entries_of(Recording))
+            self.assertEqual(len(recordings), 1)
+            self.assertEqual((recordings[0].begin, recordings[0].end), (0, 16))
+
+    def test_get_links_by_node(self):
+        agreed = [
+            m
+            for m in self.data_pack.get(PredicateMention)
+            if m.text == "agreed"
+        ][0]
+        links = self.data_pack.get_links_by_parent(agreed)
+        self.assertEqual(
+            sorted(link.arg_type for link in links), ["ARG0", "ARG1"]
+        )
+        for link in links:
+            self.assertIn(link, self.data_pack.get_links_by_child(link.child))
+
+    def test_get_list(self):
+        sentence = self.data_pack.get_single(Sentence)
+        component = utils.get_full_module_name(OntonotesReader)
+        for args in (
+            (Token,),
+            (Annotation,),
+            (Token, sentence),
+            (PredicateLink, sentence),
+            (CoreferenceGroup, sentence),
+            (EntityMention, sentence, component),
+        ):
+            self.assertEqual(
+                self.data_pack.get_list(*args), list(self.data_pack.get(*args))
+            )
 
     def test_get_entries(self):
         # case 1: test get annotation
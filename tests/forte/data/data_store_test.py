@@ -827,6 +827,20 @@ class DataStoreTest(unittest.TestCase):
             ),
             num_sent + 1,
         )
+        # a non-duplicate entry sorted after all existing entries
+        self.data_store.add_entry_raw(
+            type_name="ft.onto.base_ontology.Sentence",
+            allow_duplicate=False,
+            attribute_data=[100, 120],
+        )
+        self.assertEqual(
+            len(
+                self.data_store._DataStore__elements[
+                    "ft.onto.base_ontology.Sentence"
+                ]
+            ),
+            num_sent + 2,
+        )
 
         # check add annotation raw with tid
         tid = 77
@@ -1160,6 +1174,25 @@ class DataStoreTest(unittest.TestCase):
         )
         self.assertEqual(len(instances), 2)
 
+        # range queries reflect entries added or deleted after a query
+        tid = self.data_store.add_entry_raw(
+            type_name="ft.onto.base_ontology.Sentence",
+            attribute_data=[5, 8],
+        )
+        instances = list(
+            self.data_store.get(
+                "forte.data.ontology.top.Annotation", range_span=(1, 20)
+            )
+        )
+        self.assertEqual(len(instances), 3)
+        self.data_store.delete_entry(tid)
+        instances = list(
+            self.data_store.get(
+                "forte.data.ontology.top.Annotation", range_span=(1, 20)
+            )
+        )
+        self.assertEqual(len(instances), 2)
+
         # get groups with subclasses
         instances = list(self.data_store.get("forte.data.ontology.top.Group"))
         self.assertEqual(len(instances), 3)